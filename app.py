@@ -6,14 +6,18 @@ Persists to Delta table: ohiadev.data_feeds.intake_requests
 
 import streamlit as st
 from datetime import datetime, time
+import queue
+import re
 import uuid
+from contextlib import contextmanager
+from time import monotonic
 
-from databricks import sql
-from databricks.sdk.core import Config
-
-# Databricks configuration
-cfg = Config()
+# Databricks configuration (SDK and connector are imported lazily, see get_config/_connect)
 SQL_WAREHOUSE_HTTP_PATH = "/sql/1.0/warehouses/2b2165b53c9575f7"
+POOL_SIZE = 4  # Keep a margin below the warehouse's max concurrent queries
+POOL_TIMEOUT = 30  # Seconds to wait for a free connection before giving up
+CONNECTION_MAX_AGE = 6 * 60 * 60  # Reopen pooled connections after 6h
+CONNECTION_IDLE_CHECK = 5 * 60  # Ping connections idle longer than 5 min before reuse
 
 # Constants
 CATALOG = "ohiadev"
@@ -21,15 +25,20 @@ SCHEMA = "data_feeds"
 TABLE_NAME = "intake_requests"
 FULL_TABLE_NAME = f"{CATALOG}.{SCHEMA}.{TABLE_NAME}"
 
-# Page configuration
-st.set_page_config(
-    page_title="OHIA Data Feed Intake Form",
-    page_icon="📊",
-    layout="wide"
-)
+# Form options (index lookups avoid rebuilding lists on every rerun)
+FILE_FORMATS = ("", "CSV", "Pipe-Delimited", "Tab-Delimited", "JSON", "Parquet", "Excel", "Fixed Width")
+FILE_FORMAT_INDEX = {v: i for i, v in enumerate(FILE_FORMATS)}
+SCHEDULE_FREQUENCIES = ("", "Daily", "Weekly", "Monthly", "Ad-Hoc")
+SCHEDULE_FREQUENCY_INDEX = {v: i for i, v in enumerate(SCHEDULE_FREQUENCIES)}
+LOAD_TYPES = ("Full", "Incremental")
+LOAD_TYPE_INDEX = {v: i for i, v in enumerate(LOAD_TYPES)}
+HEADER_ROW_OPTIONS = ("Yes", "No")
+HEADER_ROW_INDEX = {True: 0, None: 0, False: 1}  # Stored as a boolean; default to "Yes"
+DELIMITER_BY_FORMAT = {"CSV": ",", "Pipe-Delimited": "|", "Tab-Delimited": "\\t"}
 
-# Custom CSS
-st.markdown("""
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[A-Za-z]{2,}")
+
+CUSTOM_CSS = """
 <style>
     .main .block-container {
         padding-top: 2rem;
@@ -42,12 +51,30 @@ st.markdown("""
         margin-top: 1rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title="OHIA Data Feed Intake Form",
+    page_icon="📊",
+    layout="wide"
+)
+
+# Custom CSS
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 @st.cache_resource
-def get_connection():
-    """Get cached SQL connection"""
+def get_config():
+    """Get cached Databricks SDK config"""
+    from databricks.sdk.core import Config
+    return Config()
+
+
+def _connect():
+    """Open a new SQL warehouse connection"""
+    from databricks import sql
+    cfg = get_config()
     return sql.connect(
         server_hostname=cfg.host,
         http_path=SQL_WAREHOUSE_HTTP_PATH,
@@ -55,88 +82,178 @@ def get_connection():
     )
 
 
-def generate_request_id():
+@st.cache_resource
+def get_pool():
+    """Get shared pool of SQL connections (opened lazily on first checkout)"""
+    # LIFO so the most recently used (warm) connection is reused first
+    pool = queue.LifoQueue(maxsize=POOL_SIZE)
+    for _ in range(POOL_SIZE):
+        pool.put(None)
+    return pool
+
+
+def _ping(conn):
+    """Check that a pooled connection is still usable"""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return True
+    except Exception:
+        return False
+
+
+def _close(conn):
+    """Close a connection, ignoring errors from an already dead handle"""
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+def _is_connection_error(error: Exception):
+    """True if error came from the connection/transport rather than the SQL itself"""
+    from databricks.sql.exc import OperationalError, RequestError
+    return isinstance(error, (OperationalError, RequestError))
+
+
+@contextmanager
+def checkout(fresh: bool = False):
+    """Borrow a pooled connection, reopening it if it is old, idle and dead, or broken"""
+    pool = get_pool()
+    try:
+        slot = pool.get(timeout=POOL_TIMEOUT)
+    except queue.Empty:
+        raise RuntimeError("All database connections are busy. Please try again in a moment.") from None
+
+    # Slots are None (not yet opened) or (connection, opened_at, last_used)
+    conn, opened_at, last_used = slot or (None, 0.0, 0.0)
+    try:
+        now = monotonic()
+        if conn is not None and (
+            fresh
+            or now - opened_at > CONNECTION_MAX_AGE
+            or (now - last_used > CONNECTION_IDLE_CHECK and not _ping(conn))
+        ):
+            _close(conn)
+            conn = None
+        if conn is None:
+            conn = _connect()
+            opened_at = now
+        yield conn
+    except Exception as e:
+        # SQL/data errors leave the connection healthy; only discard it on transport failures
+        if conn is not None and _is_connection_error(e):
+            _close(conn)
+            conn = None
+        raise
+    finally:
+        pool.put((conn, opened_at, monotonic()) if conn is not None else None)
+
+
+def run_with_connection(work):
+    """Run work(conn) on a pooled connection, retrying once on a fresh one if it drops"""
+    try:
+        with checkout() as conn:
+            return work(conn)
+    except Exception as e:
+        if not _is_connection_error(e):
+            raise
+        # Connection went stale (e.g. warehouse auto-stop); reconnect and retry once
+        with checkout(fresh=True) as conn:
+            return work(conn)
+
+
+def generate_request_id(now: datetime):
     """Generate unique request ID"""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    short_uuid = str(uuid.uuid4())[:8]
-    return f"REQ_{timestamp}_{short_uuid}"
+    return f"REQ_{now.strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
 
 
-def get_existing_requests(requestor_email: str = None):
-    """Fetch existing requests from Delta table"""
+def parse_time(value: str, default: time):
+    """Parse a stored HH:MM time, falling back to default if missing or malformed"""
+    if not value:
+        return default
     try:
-        conn = get_connection()
+        return time.fromisoformat(value)
+    except ValueError:
+        return default
+
+
+@st.cache_data(ttl=60, max_entries=128, show_spinner=False)
+def _list_requests(requestor_email: str = None, limit: int = 10) -> list[dict]:
+    """Query the most recent requests (sidebar columns only); cached per email"""
+    def work(conn):
         with conn.cursor() as cursor:
             if requestor_email:
-                query = f"SELECT * FROM {FULL_TABLE_NAME} WHERE requestor_email = '{requestor_email}' ORDER BY created_at DESC"
+                cursor.execute(
+                    f"SELECT request_id, feed_name, status FROM {FULL_TABLE_NAME} "
+                    "WHERE requestor_email = ? ORDER BY created_at DESC LIMIT ?",
+                    [requestor_email, limit],
+                )
             else:
-                query = f"SELECT * FROM {FULL_TABLE_NAME} ORDER BY created_at DESC"
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-            rows = cursor.fetchall()
-            return [dict(zip(columns, row)) for row in rows]
+                cursor.execute(
+                    f"SELECT request_id, feed_name, status FROM {FULL_TABLE_NAME} "
+                    "ORDER BY created_at DESC LIMIT ?",
+                    [limit],
+                )
+            return cursor.fetchall_arrow().to_pylist()
+
+    return run_with_connection(work)
+
+
+def get_existing_requests(requestor_email: str = None, limit: int = 10):
+    """Fetch the most recent requests from Delta table"""
+    try:
+        return _list_requests(requestor_email, limit)
     except Exception as e:
         st.warning(f"Could not fetch existing requests: {e}")
         return []
 
 
-def save_request(data: dict, is_update: bool = False):
-    """Save or update request in Delta table"""
-    try:
-        conn = get_connection()
+def save_request(data: dict):
+    """Insert or update request in Delta table with a single MERGE"""
+    columns = list(data.keys())
+    source = ', '.join(f"? AS {key}" for key in columns)
+    # created_at is only written on first insert
+    updates = ', '.join(f"{key} = s.{key}" for key in columns if key not in ('request_id', 'created_at'))
+    merge_sql = (
+        f"MERGE INTO {FULL_TABLE_NAME} AS t USING (SELECT {source}) AS s "
+        "ON t.request_id = s.request_id "
+        f"WHEN MATCHED THEN UPDATE SET {updates} "
+        f"WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) "
+        f"VALUES ({', '.join(f's.{key}' for key in columns)})"
+    )
+
+    def work(conn):
         with conn.cursor() as cursor:
-            if is_update:
-                # Build UPDATE statement
-                set_clauses = []
-                for key, value in data.items():
-                    if key != 'request_id':
-                        if value is None:
-                            set_clauses.append(f"{key} = NULL")
-                        elif isinstance(value, bool):
-                            set_clauses.append(f"{key} = {str(value).lower()}")
-                        elif isinstance(value, str):
-                            escaped_value = value.replace("'", "''")
-                            set_clauses.append(f"{key} = '{escaped_value}'")
-                        else:
-                            set_clauses.append(f"{key} = '{value}'")
-                
-                update_sql = f"UPDATE {FULL_TABLE_NAME} SET {', '.join(set_clauses)} WHERE request_id = '{data['request_id']}'"
-                cursor.execute(update_sql)
-            else:
-                # Build INSERT statement
-                columns = list(data.keys())
-                values = []
-                for v in data.values():
-                    if v is None:
-                        values.append("NULL")
-                    elif isinstance(v, bool):
-                        values.append(str(v).lower())
-                    elif isinstance(v, str):
-                        escaped_value = v.replace("'", "''")
-                        values.append(f"'{escaped_value}'")
-                    else:
-                        values.append(f"'{v}'")
-                
-                insert_sql = f"INSERT INTO {FULL_TABLE_NAME} ({', '.join(columns)}) VALUES ({', '.join(values)})"
-                cursor.execute(insert_sql)
+            cursor.execute(merge_sql, list(data.values()))
+
+    try:
+        run_with_connection(work)
+        # Drop cached reads so the sidebar and form see the new row
+        _list_requests.clear()
+        _fetch_request.clear()
         return True
     except Exception as e:
         st.error(f"Error saving request: {e}")
         return False
 
 
+@st.cache_data(ttl=30, max_entries=256, show_spinner=False)
+def _fetch_request(request_id: str) -> dict | None:
+    """Query a single full request row; cached briefly per ID"""
+    def work(conn):
+        with conn.cursor() as cursor:
+            cursor.execute(f"SELECT * FROM {FULL_TABLE_NAME} WHERE request_id = ?", [request_id])
+            rows = cursor.fetchall_arrow().to_pylist()
+            return rows[0] if rows else None
+
+    return run_with_connection(work)
+
+
 def load_request(request_id: str):
     """Load a specific request by ID"""
     try:
-        conn = get_connection()
-        with conn.cursor() as cursor:
-            query = f"SELECT * FROM {FULL_TABLE_NAME} WHERE request_id = '{request_id}'"
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-            row = cursor.fetchone()
-            if row:
-                return dict(zip(columns, row))
-            return None
+        return _fetch_request(request_id)
     except Exception as e:
         st.warning(f"Could not load request: {e}")
         return None
@@ -168,11 +285,12 @@ with st.sidebar:
     
     st.divider()
     
-    if user_email:
+    # Only query once the address looks complete, not on every half-typed keystroke
+    if user_email and EMAIL_PATTERN.fullmatch(user_email):
         existing = get_existing_requests(user_email)
         if existing:
             st.markdown("**Previous Submissions:**")
-            for req in existing[:10]:  # Show last 10
+            for req in existing:
                 status_icon = {"draft": "📝", "submitted": "📤", "complete": "✅"}.get(req.get('status', ''), "❓")
                 if st.button(f"{status_icon} {req.get('feed_name', 'Unnamed')}", key=req['request_id']):
                     st.session_state.current_request_id = req['request_id']
@@ -191,197 +309,171 @@ if st.session_state.mode == 'edit' and st.session_state.current_request_id:
 # Check if form should be read-only
 is_readonly = existing_data.get('status') == 'complete'
 
-# Form
-st.subheader("Feed Details")
+# Form (inputs only trigger a rerun on submit; a locked request has nothing to submit)
+form = st.container() if is_readonly else st.form("intake_form", clear_on_submit=False)
 
-col1, col2 = st.columns(2)
+with form:
+    st.subheader("Feed Details")
 
-with col1:
-    feed_name = st.text_input(
-        "Feed Name *",
-        value=existing_data.get('feed_name', ''),
-        placeholder="e.g., pressganey_patient_survey",
-        help="Unique identifier (lowercase, underscores)",
-        disabled=is_readonly
-    )
+    col1, col2 = st.columns(2)
+
+    with col1:
+        feed_name = st.text_input(
+            "Feed Name *",
+            value=existing_data.get('feed_name', ''),
+            placeholder="e.g., pressganey_patient_survey",
+            help="Unique identifier (lowercase, underscores)",
+            disabled=is_readonly
+        )
     
-    source_system = st.text_input(
-        "Source System Name *",
-        value=existing_data.get('source_system', ''),
-        placeholder="e.g., Epic Clarity, SFDC, Manual Upload",
-        disabled=is_readonly
-    )
+        source_system = st.text_input(
+            "Source System Name *",
+            value=existing_data.get('source_system', ''),
+            placeholder="e.g., Epic Clarity, SFDC, Manual Upload",
+            disabled=is_readonly
+        )
     
-    vendor_name = st.text_input(
-        "Vendor / Destination *",
-        value=existing_data.get('vendor_name', ''),
-        placeholder="e.g., Press Ganey, Veritas, CMS",
-        disabled=is_readonly
-    )
+        vendor_name = st.text_input(
+            "Vendor / Destination *",
+            value=existing_data.get('vendor_name', ''),
+            placeholder="e.g., Press Ganey, Veritas, CMS",
+            disabled=is_readonly
+        )
     
-    target_table = st.text_input(
-        "Target Schema/Table Name *",
-        value=existing_data.get('target_table', ''),
-        placeholder="e.g., silver.pressganey_feed",
-        disabled=is_readonly
-    )
+        target_table = st.text_input(
+            "Target Schema/Table Name *",
+            value=existing_data.get('target_table', ''),
+            placeholder="e.g., silver.pressganey_feed",
+            disabled=is_readonly
+        )
     
-    data_owner_email = st.text_input(
-        "Data Owner Email *",
-        value=existing_data.get('data_owner_email', ''),
-        placeholder="data.owner@ucla.edu",
-        disabled=is_readonly
-    )
+        data_owner_email = st.text_input(
+            "Data Owner Email *",
+            value=existing_data.get('data_owner_email', ''),
+            placeholder="data.owner@ucla.edu",
+            disabled=is_readonly
+        )
 
-with col2:
-    file_name_pattern = st.text_input(
-        "File Name Pattern *",
-        value=existing_data.get('file_name_pattern', ''),
-        placeholder="e.g., UCLA_PressGaney_{YYYYMMDD}.csv",
-        help="Use {YYYY}, {MM}, {DD} for date placeholders",
-        disabled=is_readonly
-    )
-    
-    landing_zone_path = st.text_input(
-        "File Path / Landing Zone *",
-        value=existing_data.get('landing_zone_path', ''),
-        placeholder="e.g., /mnt/landing/pressganey/",
-        disabled=is_readonly
-    )
+    with col2:
+        file_name_pattern = st.text_input(
+            "File Name Pattern *",
+            value=existing_data.get('file_name_pattern', ''),
+            placeholder="e.g., UCLA_PressGaney_{YYYYMMDD}.csv",
+            help="Use {YYYY}, {MM}, {DD} for date placeholders",
+            disabled=is_readonly
+        )
     
-    file_format = st.selectbox(
-        "File Format *",
-        options=["", "CSV", "Pipe-Delimited", "Tab-Delimited", "JSON", "Parquet", "Excel", "Fixed Width"],
-        index=["", "CSV", "Pipe-Delimited", "Tab-Delimited", "JSON", "Parquet", "Excel", "Fixed Width"].index(existing_data.get('file_format', '') if existing_data.get('file_format', '') in ["", "CSV", "Pipe-Delimited", "Tab-Delimited", "JSON", "Parquet", "Excel", "Fixed Width"] else ""),
-        disabled=is_readonly
-    )
+        landing_zone_path = st.text_input(
+            "File Path / Landing Zone *",
+            value=existing_data.get('landing_zone_path', ''),
+            placeholder="e.g., /mnt/landing/pressganey/",
+            disabled=is_readonly
+        )
     
-    # Show delimiter field only for delimited formats
-    if file_format in ["CSV", "Pipe-Delimited", "Tab-Delimited"]:
-        delimiter_options = {
-            "CSV": [","],
-            "Pipe-Delimited": ["|"],
-            "Tab-Delimited": ["\\t"]
-        }
-        delimiter = st.selectbox(
-            "Column Delimiter *",
-            options=delimiter_options.get(file_format, [","]),
+        file_format = st.selectbox(
+            "File Format *",
+            options=FILE_FORMATS,
+            index=FILE_FORMAT_INDEX.get(existing_data.get('file_format', ''), 0),
+            help="Delimited formats set the column delimiter: CSV (,), Pipe-Delimited (|), Tab-Delimited (\\t)",
             disabled=is_readonly
         )
-    else:
-        delimiter = existing_data.get('delimiter', '')
     
-    header_row = st.radio(
-        "Header Row? *",
-        options=["Yes", "No"],
-        index=0 if existing_data.get('header_row', True) in [True, None] else 1,
-        horizontal=True,
-        disabled=is_readonly
-    )
+        header_row = st.radio(
+            "Header Row? *",
+            options=HEADER_ROW_OPTIONS,
+            index=HEADER_ROW_INDEX.get(existing_data.get('header_row', True), 0),
+            horizontal=True,
+            disabled=is_readonly
+        )
 
-st.divider()
-st.subheader("Schedule & SLA")
+    st.divider()
+    st.subheader("Schedule & SLA")
 
-col3, col4 = st.columns(2)
+    col3, col4 = st.columns(2)
 
-with col3:
-    schedule_frequency = st.selectbox(
-        "Schedule Frequency *",
-        options=["", "Daily", "Weekly", "Monthly", "Ad-Hoc"],
-        index=["", "Daily", "Weekly", "Monthly", "Ad-Hoc"].index(existing_data.get('schedule_frequency', '') if existing_data.get('schedule_frequency', '') in ["", "Daily", "Weekly", "Monthly", "Ad-Hoc"] else ""),
-        disabled=is_readonly
-    )
-    
-    # Parse existing time or default to 6:00 AM
-    default_time = time(6, 0)
-    if existing_data.get('schedule_time'):
-        try:
-            parts = existing_data['schedule_time'].split(':')
-            default_time = time(int(parts[0]), int(parts[1]))
-        except:
-            pass
+    with col3:
+        schedule_frequency = st.selectbox(
+            "Schedule Frequency *",
+            options=SCHEDULE_FREQUENCIES,
+            index=SCHEDULE_FREQUENCY_INDEX.get(existing_data.get('schedule_frequency', ''), 0),
+            disabled=is_readonly
+        )
     
-    schedule_time = st.time_input(
-        "Schedule Time (PST) *",
-        value=default_time,
-        disabled=is_readonly
-    )
+        schedule_time = st.time_input(
+            "Schedule Time (PST) *",
+            value=parse_time(existing_data.get('schedule_time'), time(6, 0)),
+            disabled=is_readonly
+        )
     
-    load_type = st.radio(
-        "Load Type *",
-        options=["Full", "Incremental"],
-        index=["Full", "Incremental"].index(existing_data.get('load_type', 'Full') if existing_data.get('load_type', 'Full') in ["Full", "Incremental"] else "Full"),
-        horizontal=True,
-        disabled=is_readonly
-    )
+        load_type = st.radio(
+            "Load Type *",
+            options=LOAD_TYPES,
+            index=LOAD_TYPE_INDEX.get(existing_data.get('load_type', 'Full'), 0),
+            horizontal=True,
+            disabled=is_readonly
+        )
 
-with col4:
-    # Parse existing SLA time or default to 8:00 AM
-    default_sla = time(8, 0)
-    if existing_data.get('sla_time'):
-        try:
-            parts = existing_data['sla_time'].split(':')
-            default_sla = time(int(parts[0]), int(parts[1]))
-        except:
-            pass
-    
-    sla_time = st.time_input(
-        "SLA - File Must Arrive By (PST) *",
-        value=default_sla,
-        help="Alert if file hasn't arrived by this time",
-        disabled=is_readonly
-    )
+    with col4:
+        sla_time = st.time_input(
+            "SLA - File Must Arrive By (PST) *",
+            value=parse_time(existing_data.get('sla_time'), time(8, 0)),
+            help="Alert if file hasn't arrived by this time",
+            disabled=is_readonly
+        )
 
-st.divider()
-st.subheader("Requestor Information")
+    st.divider()
+    st.subheader("Requestor Information")
 
-col5, col6 = st.columns(2)
+    col5, col6 = st.columns(2)
 
-with col5:
-    requestor_name = st.text_input(
-        "Your Name *",
-        value=existing_data.get('requestor_name', ''),
-        placeholder="Full name",
-        disabled=is_readonly
-    )
+    with col5:
+        requestor_name = st.text_input(
+            "Your Name *",
+            value=existing_data.get('requestor_name', ''),
+            placeholder="Full name",
+            disabled=is_readonly
+        )
 
-with col6:
-    requestor_email = st.text_input(
-        "Your Email *",
-        value=existing_data.get('requestor_email', user_email or ''),
-        placeholder="your.email@ucla.edu",
-        disabled=is_readonly
-    )
+    with col6:
+        requestor_email = st.text_input(
+            "Your Email *",
+            value=existing_data.get('requestor_email', user_email or ''),
+            placeholder="your.email@ucla.edu",
+            disabled=is_readonly
+        )
 
-st.divider()
+    st.divider()
 
-# Notes field
-notes = st.text_area(
-    "Additional Notes",
-    value=existing_data.get('notes', '') or '',
-    placeholder="Any additional context or requirements...",
-    height=100,
-    disabled=is_readonly
-)
+    # Notes field
+    notes = st.text_area(
+        "Additional Notes",
+        value=existing_data.get('notes', '') or '',
+        placeholder="Any additional context or requirements...",
+        height=100,
+        disabled=is_readonly
+    )
 
-st.divider()
+    st.divider()
 
-# Action buttons
-if not is_readonly:
-    col_btn1, col_btn2, col_btn3, col_btn4 = st.columns([1, 1, 1, 2])
-    
-    with col_btn1:
-        save_draft = st.button("💾 Save Draft", type="secondary")
-    
-    with col_btn2:
-        submit = st.button("📤 Submit", type="primary")
-    
-    with col_btn3:
-        if st.session_state.mode == 'edit' and existing_data.get('status') == 'submitted':
-            mark_complete = st.button("✅ Mark Complete")
-        else:
-            mark_complete = False
-    
+    # Action buttons
+    save_draft = submit = mark_complete = False
+    if not is_readonly:
+        col_btn1, col_btn2, col_btn3, col_btn4 = st.columns([1, 1, 1, 2])
+        
+        with col_btn1:
+            save_draft = st.form_submit_button("💾 Save Draft", type="secondary")
+        
+        with col_btn2:
+            submit = st.form_submit_button("📤 Submit", type="primary")
+        
+        with col_btn3:
+            if st.session_state.mode == 'edit' and existing_data.get('status') == 'submitted':
+                mark_complete = st.form_submit_button("✅ Mark Complete")
+
+# Handle save/submit
+if is_readonly:
+    st.info("This request is complete and locked for editing.")
+elif save_draft or submit or mark_complete:
     # Validation
     required_fields = {
         "Feed Name": feed_name,
@@ -399,66 +491,60 @@ if not is_readonly:
     
     missing = [k for k, v in required_fields.items() if not v]
     
-    # Handle save/submit
-    if save_draft or submit or mark_complete:
-        if submit and missing:
-            st.error(f"Please fill in required fields: {', '.join(missing)}")
+    if submit and missing:
+        st.error(f"Please fill in required fields: {', '.join(missing)}")
+    else:
+        # Determine status
+        if mark_complete:
+            status = "complete"
+        elif submit:
+            status = "submitted"
         else:
-            # Determine status
-            if mark_complete:
-                status = "complete"
-            elif submit:
-                status = "submitted"
-            else:
-                status = "draft"
-            
-            # Build record
-            now = datetime.now()
-            request_id = existing_data.get('request_id') or generate_request_id()
-            
-            record = {
-                "request_id": request_id,
-                "feed_name": feed_name,
-                "source_system": source_system,
-                "vendor_name": vendor_name,
-                "target_table": target_table,
-                "data_owner_email": data_owner_email,
-                "file_name_pattern": file_name_pattern,
-                "landing_zone_path": landing_zone_path,
-                "file_format": file_format,
-                "delimiter": delimiter if file_format in ["CSV", "Pipe-Delimited", "Tab-Delimited"] else None,
-                "header_row": header_row == "Yes",
-                "schedule_frequency": schedule_frequency,
-                "schedule_time": schedule_time.strftime("%H:%M"),
-                "load_type": load_type,
-                "sla_time": sla_time.strftime("%H:%M"),
-                "requestor_name": requestor_name,
-                "requestor_email": requestor_email,
-                "notes": notes,
-                "status": status,
-                "created_at": existing_data.get('created_at') or now.isoformat(),
-                "updated_at": now.isoformat(),
-            }
-            
-            is_update = st.session_state.mode == 'edit'
+            status = "draft"
+        
+        # Build record
+        now = datetime.now()
+        ts = now.isoformat()
+        request_id = existing_data.get('request_id') or generate_request_id(now)
+        
+        record = {
+            "request_id": request_id,
+            "feed_name": feed_name,
+            "source_system": source_system,
+            "vendor_name": vendor_name,
+            "target_table": target_table,
+            "data_owner_email": data_owner_email,
+            "file_name_pattern": file_name_pattern,
+            "landing_zone_path": landing_zone_path,
+            "file_format": file_format,
+            "delimiter": DELIMITER_BY_FORMAT.get(file_format),
+            "header_row": header_row == "Yes",
+            "schedule_frequency": schedule_frequency,
+            "schedule_time": schedule_time.strftime("%H:%M"),
+            "load_type": load_type,
+            "sla_time": sla_time.strftime("%H:%M"),
+            "requestor_name": requestor_name,
+            "requestor_email": requestor_email,
+            "notes": notes,
+            "status": status,
+            "created_at": existing_data.get('created_at') or ts,
+            "updated_at": ts,
+        }
+        
+        if save_request(record):
+            if status == "draft":
+                st.success(f"✅ Draft saved! Request ID: `{request_id}`")
+            elif status == "submitted":
+                st.success(f"✅ Request submitted! Request ID: `{request_id}`")
+                st.info("Next step: Write your SQL code and commit to Git.")
+            elif status == "complete":
+                st.success(f"✅ Request marked as complete! Request ID: `{request_id}`")
+                st.balloons()
             
-            if save_request(record, is_update):
-                if status == "draft":
-                    st.success(f"✅ Draft saved! Request ID: `{request_id}`")
-                elif status == "submitted":
-                    st.success(f"✅ Request submitted! Request ID: `{request_id}`")
-                    st.info("Next step: Write your SQL code and commit to Git.")
-                elif status == "complete":
-                    st.success(f"✅ Request marked as complete! Request ID: `{request_id}`")
-                    st.balloons()
-                
-                st.session_state.current_request_id = request_id
-                st.session_state.mode = 'edit'
-            else:
-                st.error("Failed to save. Please try again.")
-
-else:
-    st.info("This request is complete and locked for editing.")
+            st.session_state.current_request_id = request_id
+            st.session_state.mode = 'edit'
+        else:
+            st.error("Failed to save. Please try again.")
 
 # Footer
 st.divider()
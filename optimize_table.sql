@@ -0,0 +1,8 @@
+-- Data layout maintenance for ohiadev.data_feeds.intake_requests
+-- The sidebar lists requests with WHERE requestor_email = ? ORDER BY created_at DESC.
+-- Delta already collects file statistics on the first 32 columns, which include
+-- requestor_email, so Z-ordering on it lets the warehouse skip unrelated files.
+
+-- Schedule as a daily Databricks job: co-locate rows by requestor
+OPTIMIZE ohiadev.data_feeds.intake_requests
+ZORDER BY (requestor_email);